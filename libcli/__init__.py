@@ -47,7 +47,24 @@ a default value in an argument/option's help string.
 * Supports single command applications, and command/sub-commands applications.
 """
 
-from libcli.basecli import BaseCLI  # noqa
-from libcli.basecmd import BaseCmd  # noqa
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from libcli.basecli import BaseCLI  # noqa
+    from libcli.basecmd import BaseCmd  # noqa
 
 __all__ = ["BaseCLI", "BaseCmd"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import `BaseCLI`/`BaseCmd` lazily, on first access (PEP 562)."""
+
+    if name == "BaseCLI":
+        from libcli.basecli import BaseCLI
+
+        return BaseCLI
+    if name == "BaseCmd":
+        from libcli.basecmd import BaseCmd
+
+        return BaseCmd
+    raise AttributeError(name)
@@ -0,0 +1,81 @@
+"""On-disk cache of parsed TOML config files.
+
+Re-parsing the same TOML config on every invocation is repeated work; a
+pickled dict keyed by the file's mtime and size loads an order of
+magnitude faster. Set `LIBCLI_NO_CONFIG_CACHE=1` to bypass.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any
+
+__all__ = ["load_toml_cached"]
+
+
+def _cache_path(path: Path) -> Path:
+    """Return cache file path for config file `path`."""
+
+    digest = hashlib.md5(str(path).encode(), usedforsecurity=False).hexdigest()
+    root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return root / "libcli" / f"{digest}.pkl"
+
+
+def _parse_toml(path: Path) -> dict[str, Any]:
+    """Parse TOML `path` with the fastest available backend.
+
+    Prefers `rtoml` (rust) when installed, else stdlib `tomllib`
+    (3.11+), else `tomli`.
+    """
+
+    # pylint: disable=import-outside-toplevel
+    try:
+        import rtoml  # type: ignore[import-not-found]
+    except ImportError:
+        pass
+    else:
+        return dict(rtoml.loads(path.read_text(encoding="utf-8")))
+
+    try:
+        import tomllib  # python >= 3.11
+    except ImportError:
+        import tomli as tomllib  # type: ignore[no-redef]
+
+    with open(path, "rb") as fp:
+        return tomllib.load(fp)
+
+
+def load_toml_cached(path: Path) -> dict[str, Any]:
+    """Parse TOML `path`, using/refreshing the on-disk pickle cache.
+
+    Propagates `FileNotFoundError` (etc.) from reading `path`; any cache
+    trouble silently falls back to parsing.
+    """
+
+    if os.environ.get("LIBCLI_NO_CONFIG_CACHE"):
+        return _parse_toml(path)
+
+    stat = path.stat()
+    key = f"{stat.st_mtime_ns}:{stat.st_size}".encode()
+
+    cache = _cache_path(path)
+    try:
+        with open(cache, "rb") as fp:
+            if fp.readline().rstrip() == key:
+                return pickle.load(fp)  # type: ignore[no-any-return]
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    config = _parse_toml(path)
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmpname = tempfile.mkstemp(dir=cache.parent)
+        with os.fdopen(fd, mode="wb") as fp:
+            fp.write(key + b"\n")
+            pickle.dump(config, fp, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmpname, cache)
+    except OSError:
+        pass
+    return config
@@ -0,0 +1,104 @@
+"""On-disk cache for rendered help text.
+
+`--long-help`/`--md-help` output is deterministic for a given package
+version, so re-rendering it on every invocation is wasted work; persist
+the rendered string under `~/.cache/libcli/` and reuse it while the
+entry point is unchanged. Set `LIBCLI_NO_HELP_CACHE=1` to bypass.
+"""
+
+import argparse
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import Callable
+
+__all__ = ["cache_key", "cached_render", "dist_version"]
+
+# leading byte of every cache file; bump when the on-disk format changes
+# so stale caches from older libcli versions are re-rendered, not misread.
+_FORMAT_VERSION = b"\x01"
+
+
+def dist_version(namespace: argparse.Namespace) -> str:
+    """Return installed version of the running CLI, else `0.0.0`."""
+
+    # pylint: disable=import-outside-toplevel
+    from libcli.actions.version import _cached_version
+
+    if (cli := getattr(namespace, "cli", None)) is not None and cli.distname:
+        return _cached_version(cli.distname)
+    return "0.0.0"
+
+
+def cache_key(
+    kind: str,
+    parser: argparse.ArgumentParser,
+    namespace: argparse.Namespace,
+) -> str | None:
+    """Return the cache key for this render, or None when not cacheable.
+
+    Rendered help varies with more than prog and version: `_finalize`
+    picks a color or plain formatter per run, help wraps to the
+    terminal width, and a config file bakes its values into
+    `(default: ...)` help text. Key on the formatter and width, and
+    skip the cache for config-driven runs and for uninstalled
+    programs, where the `0.0.0` version cannot invalidate stale
+    entries.
+    """
+
+    if (version := dist_version(namespace)) == "0.0.0":
+        return None
+    cli = getattr(namespace, "cli", None)
+    if cli is not None and cli.config.get("config-file"):
+        return None
+    width = shutil.get_terminal_size().columns
+    return f"{kind}:{parser.prog}:{version}:{parser.formatter_class.__name__}:{width}"
+
+
+def _cache_path(key: str) -> Path | None:
+    """Return cache file path for `key`, or None if unknowable."""
+
+    try:
+        # invalidate when the entry point itself changes.
+        mtime = int(os.stat(sys.argv[0]).st_mtime)
+    except OSError:
+        return None
+    digest = hashlib.md5(f"{key}:{mtime}".encode(), usedforsecurity=False).hexdigest()
+    root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return root / "libcli" / f"{digest}.txt"
+
+
+def cached_render(key: str | None, producer: Callable[[], str]) -> str:
+    """Return `producer()` output, cached on disk under `key`.
+
+    `key` comes from `cache_key` (None means render uncached); the
+    entry-point mtime is mixed in here. On any cache trouble, fall
+    back to rendering.
+    """
+
+    if key is None or os.environ.get("LIBCLI_NO_HELP_CACHE"):
+        return producer()
+
+    if (path := _cache_path(key)) is None:
+        return producer()
+
+    try:
+        data = path.read_bytes()
+        if data[:1] == _FORMAT_VERSION:
+            return data[1:].decode("utf-8")
+    except OSError:
+        pass
+
+    text = producer()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmpname = tempfile.mkstemp(dir=path.parent)
+        with os.fdopen(fd, mode="wb") as fp:
+            fp.write(_FORMAT_VERSION + text.encode("utf-8"))
+        os.replace(tmpname, path)
+    except OSError:
+        pass
+    return text
@@ -9,3 +9,5 @@ class BaseAction(argparse.Action):
     # pylint: disable=abstract-method
     # pylint: disable=too-few-public-methods
     """Base class for our `Actions`s."""
+
+    __slots__ = ()
@@ -1,11 +1,127 @@
 """Base class for our `HelpAction`s."""
 
 import argparse
+import contextlib
+import os
+import stat
+import sys
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Sequence
 
 __all__ = ["BaseHelpAction"]
 
+# pylint: disable=protected-access
 
-class BaseHelpAction(argparse._HelpAction):
-    # pylint: disable=protected-access
-    # pylint: disable=too-few-public-methods
-    """Base class for our `HelpAction`s."""
+_SubParsersAction = argparse._SubParsersAction
+
+_HELP_CACHE: dict[tuple[int, type], str] = {}
+
+
+def _format_help_cached(parser: argparse.ArgumentParser) -> str:
+    """Return `parser.format_help()`, memoized per parser and formatter class."""
+
+    key = (id(parser), parser.formatter_class)
+    if (text := _HELP_CACHE.get(key)) is None:
+        text = _HELP_CACHE.setdefault(key, parser.format_help())
+        weakref.finalize(parser, _HELP_CACHE.pop, key, None)
+    return text
+
+
+def _write_help_text(text: str) -> None:
+    """Write `text` to stdout, encoding once via the binary buffer.
+
+    On posix, when stdout is a real pipe or tty, skip the io stack and
+    write the encoded bytes straight to the file descriptor.
+    """
+
+    data = text.encode("utf-8", errors="replace")
+
+    if os.name == "posix":
+        with contextlib.suppress(AttributeError, OSError, ValueError):
+            fd = sys.stdout.fileno()
+            mode = os.fstat(fd).st_mode
+            if stat.S_ISFIFO(mode) or stat.S_ISCHR(mode):
+                sys.stdout.flush()
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view) :]
+                return
+
+    if (buffer := getattr(sys.stdout, "buffer", None)) is not None:
+        sys.stdout.flush()
+        buffer.write(data)
+        buffer.flush()
+    else:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+
+def _warm_help_cache(parsers: Sequence[argparse.ArgumentParser]) -> None:
+    """Pre-render help for `parsers` into `_HELP_CACHE`.
+
+    With many subparsers, render on a thread pool; the formatter spends
+    much of its time in C-level string/regex code that releases the GIL.
+    Below the threshold, the sequential path is cheaper than pool setup.
+    """
+
+    if len(parsers) >= 8:
+        with ThreadPoolExecutor(max_workers=min(8, len(parsers))) as executor:
+            list(executor.map(_format_help_cached, parsers))
+
+
+def _get_subparsers_action(
+    parser: argparse.ArgumentParser,
+) -> argparse._SubParsersAction | None:
+    """Return `parser`'s subparsers action, or None.
+
+    Prefer the direct reference stashed by `BaseCLI._init_subcommands`;
+    fall back to scanning `parser._subparsers._actions`.
+    """
+
+    if (action := getattr(parser, "_subparsers_action", None)) is not None:
+        return action  # type: ignore[no-any-return]
+    if parser._subparsers:
+        for action in parser._subparsers._actions:
+            # identity check first; isinstance only for subclasses.
+            if type(action) is _SubParsersAction or isinstance(action, _SubParsersAction):
+                return action
+    return None
+
+
+class BaseHelpAction(argparse.Action):
+    # pylint: disable=redefined-builtin
+    """Base class for our `HelpAction`s.
+
+    Inherits `argparse.Action` directly, skipping `argparse._HelpAction`;
+    the default `__call__` prints help and exits, as `-h` does.
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        option_strings: Sequence[str],
+        dest: str = argparse.SUPPRESS,
+        default: Any = argparse.SUPPRESS,
+        help: str | None = None,
+    ) -> None:
+        """Initialize `BaseHelpAction`."""
+        super().__init__(
+            option_strings=option_strings,
+            dest=dest,
+            default=default,
+            nargs=0,
+            help=help,
+        )
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        _values: str | Sequence[Any] | None,
+        _option_string: str | None = None,
+    ) -> None:
+        """Print help and exit."""
+        parser.print_help()
+        parser.exit()
@@ -3,14 +3,34 @@
 import argparse
 from typing import Any, Sequence
 
-from libcli.actions.basehelp import BaseHelpAction
+from libcli.actions._helpcache import cache_key, cached_render
+from libcli.actions.basehelp import (
+    BaseHelpAction,
+    _format_help_cached,
+    _get_subparsers_action,
+    _warm_help_cache,
+    _write_help_text,
+)
 
 __all__ = ["LongHelpAction"]
 
+_WIDTH = 80
+_DASHES = "-" * _WIDTH
+
+
+def _banner(prog: str) -> str:
+    """Return `prog` centered in an 80-column strip of dashes."""
+
+    label = f" {prog.upper()} "
+    pad = (_WIDTH - len(label)) // 2
+    return _DASHES[:pad] + label + _DASHES[: _WIDTH - pad - len(label)] + "\n\n"
+
 
 class LongHelpAction(BaseHelpAction):
     """Print help for all commands."""
 
+    __slots__ = ()
+
     def __call__(
         self,
         parser: argparse.ArgumentParser,
@@ -20,21 +40,39 @@ class LongHelpAction(BaseHelpAction):
     ) -> None:
         """Print help for all commands."""
 
-        def _print_help(parser: argparse.ArgumentParser) -> None:
-            print(f" {parser.prog.upper()} ".center(80, "-") + "\n")
-            print(parser.format_help())
+        text = cached_render(
+            cache_key("long", parser, namespace),
+            lambda: self._render(parser),
+        )
+        _write_help_text(text)
+        parser.exit()
 
-        _print_help(parser)
+    @staticmethod
+    def _render(parser: argparse.ArgumentParser) -> str:
+        """Render help for `parser` and all of its subparsers."""
 
-        if not parser._subparsers:
-            parser.exit()
+        chunks: list[str] = []
 
-        for action in parser._subparsers._actions:
-            if isinstance(action, argparse._SubParsersAction):
-                for subparser in action.choices.values():
-                    _print_help(subparser)
+        def _format_help(parser: argparse.ArgumentParser) -> None:
+            # `prog` is stable; build the banner once per parser.
+            if (header := getattr(parser, "_libcli_header", None)) is None:
+                header = _banner(parser.prog)
+                parser._libcli_header = header  # type: ignore[attr-defined]
+            chunks.append(header)
+            chunks.append(_format_help_cached(parser) + "\n")
 
-        parser.exit()
+        _format_help(parser)
+
+        if (action := _get_subparsers_action(parser)) is not None and action.choices:
+            if hasattr(action, "_materialize_all"):
+                action._materialize_all()
+            # aliases repeat the same subparser; render each once.
+            subparsers = list(dict.fromkeys(action.choices.values()))
+            _warm_help_cache(subparsers)
+            for subparser in subparsers:
+                _format_help(subparser)
+
+        return "".join(chunks)
 
 
 #   @staticmethod
@@ -3,7 +3,14 @@
 import argparse
 from typing import Any, Sequence
 
-from libcli.actions.basehelp import BaseHelpAction
+from libcli.actions._helpcache import cache_key, cached_render
+from libcli.actions.basehelp import (
+    BaseHelpAction,
+    _format_help_cached,
+    _get_subparsers_action,
+    _warm_help_cache,
+    _write_help_text,
+)
 
 __all__ = ["LongMarkdownHelpAction"]
 
@@ -11,6 +18,8 @@ __all__ = ["LongMarkdownHelpAction"]
 class LongMarkdownHelpAction(BaseHelpAction):
     """Print help for all commands in markdown."""
 
+    __slots__ = ()
+
     def __call__(
         self,
         parser: argparse.ArgumentParser,
@@ -20,20 +29,38 @@ class LongMarkdownHelpAction(BaseHelpAction):
     ) -> None:
         """Print help for all commands in markdown."""
 
-        def _print_help(parser: argparse.ArgumentParser, atx: str) -> None:
-            print(atx, parser.prog)
-            print("```\n" + parser.format_help().rstrip() + "\n```\n")
+        text = cached_render(
+            cache_key("md", parser, namespace),
+            lambda: self._render(parser),
+        )
+        _write_help_text(text)
+        parser.exit()
 
-        parser.formatter_class = argparse.RawDescriptionHelpFormatter
-        _print_help(parser, "#")
+    @staticmethod
+    def _render(parser: argparse.ArgumentParser) -> str:
+        """Render markdown help for `parser` and all of its subparsers."""
 
-        if not parser._subparsers:
-            parser.exit()
+        chunks: list[str] = []
 
-        for action in parser._subparsers._actions:
-            if isinstance(action, argparse._SubParsersAction):
-                for subparser in action.choices.values():
-                    subparser.formatter_class = argparse.RawDescriptionHelpFormatter
-                    _print_help(subparser, "##")
+        def _format_help(parser: argparse.ArgumentParser, atx: str) -> None:
+            chunks.append(f"{atx} {parser.prog}\n")
+            chunks.append("```\n" + _format_help_cached(parser).rstrip() + "\n```\n\n")
 
-        parser.exit()
+        formatter = argparse.RawDescriptionHelpFormatter
+        if parser.formatter_class is not formatter:
+            parser.formatter_class = formatter
+        _format_help(parser, "#")
+
+        if (action := _get_subparsers_action(parser)) is not None and action.choices:
+            if hasattr(action, "_materialize_all"):
+                action._materialize_all()
+            # aliases repeat the same subparser; render each once.
+            subparsers = list(dict.fromkeys(action.choices.values()))
+            for subparser in subparsers:
+                if subparser.formatter_class is not formatter:
+                    subparser.formatter_class = formatter
+            _warm_help_cache(subparsers)
+            for subparser in subparsers:
+                _format_help(subparser, "##")
+
+        return "".join(chunks)
@@ -4,7 +4,6 @@ import argparse
 from typing import Any, Sequence
 
 from libcli.actions.basehelp import BaseHelpAction
-from libcli.formatters.markdown import MarkdownHelpFormatter
 
 __all__ = ["MarkdownHelpAction"]
 
@@ -12,6 +11,8 @@ __all__ = ["MarkdownHelpAction"]
 class MarkdownHelpAction(BaseHelpAction):
     """Print help in markdown."""
 
+    __slots__ = ()
+
     def __call__(
         self,
         parser: argparse.ArgumentParser,
@@ -21,6 +22,12 @@ class MarkdownHelpAction(BaseHelpAction):
     ) -> None:
         """Print help in markdown."""
 
+        # defer; only `--md-help` runs pay for the markdown formatter.
+        # formatter instances are single-use accumulators, so let
+        # `_get_formatter` build a fresh one per render.
+        # pylint: disable=import-outside-toplevel
+        from libcli.formatters.markdown import MarkdownHelpFormatter
+
         parser.formatter_class = MarkdownHelpFormatter
         parser.print_help()
         parser.exit()
@@ -0,0 +1,65 @@
+"""Print version number and exit."""
+
+import argparse
+import contextlib
+import functools
+import importlib.metadata
+import sys
+from typing import Any, Sequence
+
+from libcli.actions.base import BaseAction
+
+__all__ = ["LazyVersionAction"]
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_version(distname: str) -> str:
+    """Return version of `distname`, caching the sys.path dist-info scan."""
+
+    with contextlib.suppress(importlib.metadata.PackageNotFoundError):
+        return importlib.metadata.version(distname)
+    return "0.0.0"
+
+
+class LazyVersionAction(BaseAction):
+    # pylint: disable=redefined-builtin
+    """Print version number and exit.
+
+    Like `action="version"`, but the `importlib.metadata` lookup (a
+    sys.path walk) is deferred until `--version` is actually given.
+    """
+
+    def __init__(
+        self,
+        option_strings: Sequence[str],
+        dest: str = argparse.SUPPRESS,
+        default: Any = argparse.SUPPRESS,
+        distname: str | None = None,
+        help: str | None = None,
+    ) -> None:
+        """Initialize `LazyVersionAction`."""
+        super().__init__(
+            option_strings=option_strings,
+            dest=dest,
+            default=default,
+            nargs=0,
+            help=help,
+        )
+        self.distname = distname
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        _values: str | Sequence[Any] | None,
+        _option_string: str | None = None,
+    ) -> None:
+        """Print version number and exit."""
+
+        version = _cached_version(self.distname or parser.prog)
+
+        # pylint: disable=protected-access
+        formatter = parser._get_formatter()
+        formatter.add_text(version)
+        parser._print_message(formatter.format_help(), sys.stdout)
+        parser.exit()
@@ -5,34 +5,20 @@ This module provides the `BaseCLI` class.
 
 import argparse
 import contextlib
+import functools
 import importlib
 import importlib.metadata
+import importlib.util
 import logging
 import os
 import pkgutil
 import sys
 import textwrap
 from pathlib import Path
-from typing import Any, Callable
-
-import argcomplete
-import tomli
-from colors.colors import color  # type: ignore
-
-with contextlib.suppress(ImportError):
-    from loguru import logger  # type: ignore
-
-with contextlib.suppress(ImportError):
-    import icecream  # type: ignore
-    from icecream import ic  # noqa
-
-    icecream.install()
-    icecream.ic.configureOutput(prefix="=====>\n", includeContext=True)
+from typing import Any, Callable, Iterable, Sequence
 
 from libcli.actions.basehelp import BaseHelpAction
-from libcli.actions.longhelp import LongHelpAction
-from libcli.actions.longmarkdown import LongMarkdownHelpAction
-from libcli.actions.markdown import MarkdownHelpAction
+from libcli.actions.version import LazyVersionAction
 from libcli.formatters.color import ColorHelpFormatter
 from libcli.options.completion import CompletionOption
 from libcli.options.printconfig import PrintConfigOption
@@ -42,6 +28,93 @@ __all__ = ["BaseCLI"]
 
 # pylint: disable=protected-access
 
+_HOME = Path.home()
+_HOME_STR = str(_HOME)
+
+
+class _RetryParse(Exception):
+    """Internal: first parse failed while command modules were pruned."""
+
+
+@functools.lru_cache(maxsize=None)
+def _iter_command_modules(modname: str) -> tuple[Any, ...]:
+    """Discover the submodules of package `modname` once per process.
+
+    `find_spec` and `pkgutil.iter_modules` stat the filesystem; the
+    package contents do not change within a run, so cache the walk.
+    """
+
+    spec = importlib.util.find_spec(modname)
+    if spec is None or not spec.submodule_search_locations:
+        raise ModuleNotFoundError(f"No commands package named {modname!r}")
+    return tuple(pkgutil.iter_modules(spec.submodule_search_locations))
+
+
+def _deferred_help_action(impl: str) -> type[BaseHelpAction]:
+    """Return a `BaseHelpAction` that imports its implementation on use.
+
+    Every run registers the long/markdown help options, but almost none
+    invoke them; defer those modules (and their caching machinery) until
+    the option actually fires.
+    """
+
+    class _DeferredHelpAction(BaseHelpAction):
+        __slots__ = ()
+
+        def __call__(
+            self,
+            parser: argparse.ArgumentParser,
+            namespace: argparse.Namespace,
+            values: str | Sequence[Any] | None,
+            option_string: str | None = None,
+        ) -> None:
+            modname, _, clsname = impl.rpartition(".")
+            cls = getattr(importlib.import_module(modname), clsname)
+            # become the real action; layouts are identical.
+            self.__class__ = cls
+            self(parser, namespace, values, option_string)
+
+    return _DeferredHelpAction
+
+
+LongHelpAction = _deferred_help_action("libcli.actions.longhelp.LongHelpAction")
+LongMarkdownHelpAction = _deferred_help_action("libcli.actions.longmarkdown.LongMarkdownHelpAction")
+MarkdownHelpAction = _deferred_help_action("libcli.actions.markdown.MarkdownHelpAction")
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_help(
+    text: str | None,
+    first_xform: Callable[[str], str] | None,
+    ending: str,
+) -> str | None:
+    """Return help `text` with normalized first-character and line-ending.
+
+    Memoized; stock help lines recur verbatim across subparsers."""
+
+    if text and text is not argparse.SUPPRESS:
+        if ending and not text.endswith(ending):
+            text += ending
+        if first_xform is not None and (first := first_xform(text[0])) != text[0]:
+            # most help strings are already cased correctly; don't
+            # reallocate those.
+            text = first + text[1:]
+    return text
+
+
+@functools.lru_cache(maxsize=None)
+def _ansi(fg: str, label: str) -> tuple[str, str]:
+    """Return constant `(prefix, reset)` strings for a `fg`-colored `label`.
+
+    Imports `colors` on first use; the escape codes never change, so
+    each message only pays an f-string concat.
+    """
+
+    from colors.colors import color  # type: ignore # pylint: disable=import-outside-toplevel
+
+    prefix, _, reset = str(color("|", fg)).partition("|")
+    return prefix + label, reset
+
 
 class BaseCLI:
     """Command line interface base class.
@@ -131,6 +204,8 @@ class BaseCLI:
     help_first_char = "upper"
     help_line_ending = "."
     init_logging_called = False
+    # set when module pruning left command modules unloaded.
+    _pruned_command_modules: tuple[Any, ...] | None = None
 
     def __init__(self, argv: list[str] | None = None) -> None:
         """Build and parse command line.
@@ -160,14 +235,24 @@ class BaseCLI:
                         of all help strings.
         """
 
-        self.argv = argv
+        # normalize once; every later consumer (argv scans, argparse)
+        # shares this list instead of re-slicing sys.argv.
+        self.argv = list(sys.argv[1:]) if argv is None else list(argv)
+        # computed once; help-only code paths key off it.
+        self._help_requested = bool(os.getenv("_ARGCOMPLETE")) or any(
+            arg in ("-h", "--help", "-H", "--long-help", "--md-help") for arg in self.argv
+        )
         self.init_config()
         self.init_parser()
         self.set_defaults()
         self.add_arguments()
         self._add_common_options(self.parser)
         self._finalize()
-        argcomplete.autocomplete(self.parser)
+        if os.environ.get("_ARGCOMPLETE"):
+            # deferred; autocomplete is a no-op without this env var.
+            import argcomplete  # pylint: disable=import-outside-toplevel
+
+            argcomplete.autocomplete(self.parser)
         self.options = self._parse_args()
 
     def init_config(self) -> None:
@@ -200,11 +285,37 @@ class BaseCLI:
         self.config = base_config
 
         # don't `--print-config` any of the base items or user excludes.
-        for key in base_config:
-            if key not in self.exclude_print_config:
-                self.exclude_print_config.append(key)
+        # build a fresh instance list; appending would mutate the class
+        # attribute shared by every subclass.
+        excluded = set(self.exclude_print_config)
+        excluded.update(base_config)
+        self.exclude_print_config = list(excluded)
+
+        # help/version/completion runs exit before using file config;
+        # don't pay to read and parse it. subclass hooks may read
+        # `self.options` while building the parser, so seed the peek
+        # namespace they always had.
+        if self._is_help_fast_path():
+            self.options = argparse.Namespace(verbose=0, config_file=None)
+        else:
+            self._update_config_from_file()
+
+    def _is_help_fast_path(self) -> bool:
+        """Return True when this run clearly won't use file config.
+
+        True for shell-completion callbacks, and for command lines that
+        request help or version without naming a `--config FILE`.
+        """
 
-        self._update_config_from_file()
+        if os.environ.get("_ARGCOMPLETE"):
+            return True
+        if self.config.get("config-file"):
+            # a default config file may provide `dist-name` for `-V`.
+            return False
+        argv = self.argv
+        if any(arg == "--config" or arg.startswith("--config=") for arg in argv):
+            return False
+        return any(arg in ("-h", "--help", "-V", "--version") for arg in argv)
 
     def init_logging(self, verbose: int) -> None:
         """Set logging levels based on `--verbose`."""
@@ -217,7 +328,10 @@ class BaseCLI:
             _ = [logging.WARNING, logging.INFO, logging.DEBUG]
             logging.basicConfig(level=_[min(verbose, len(_) - 1)])
 
-            if "logger" in globals():
+            with contextlib.suppress(ImportError):
+                # pylint: disable=import-outside-toplevel
+                from loguru import logger  # type: ignore
+
                 # loguru:
                 #    (dflt)  -v       -vv
                 _ = ["INFO", "DEBUG", "TRACE"]
@@ -225,6 +339,19 @@ class BaseCLI:
                 logger.remove()
                 logger.add(sys.stderr, level=level)
 
+            if verbose >= 2 or os.getenv("ICECREAM"):
+                self._install_icecream()
+
+    @staticmethod
+    def _install_icecream() -> None:
+        """Install `icecream`'s `ic` into builtins, if available."""
+
+        with contextlib.suppress(ImportError):
+            import icecream  # type: ignore # pylint: disable=import-outside-toplevel
+
+            icecream.install()
+            icecream.ic.configureOutput(prefix="=====>\n", includeContext=True)
+
     def init_parser(self) -> None:
         """Implement in subclass, if desired."""
         self.ArgumentParser()
@@ -253,7 +380,7 @@ class BaseCLI:
         self.parser.set_defaults(cli=self)
         return self.parser
 
-    def add_subcommand_classes(self, subcommand_classes: list[Any]) -> None:
+    def add_subcommand_classes(self, subcommand_classes: Iterable[Any]) -> None:
         """Add list of subcommands to this parser."""
 
         # https://docs.python.org/3/library/argparse.html#sub-commands
@@ -304,32 +431,89 @@ class BaseCLI:
         self._init_subcommands(metavar="COMMAND", title="Specify one of")
         self.parser.set_defaults(cmd=None)
 
-        commands_module_path = importlib.import_module(modname, __name__).__path__
         base_name = (prefix or "") + (suffix or "")
 
-        for modinfo in pkgutil.iter_modules(commands_module_path):
+        # `find_spec` locates the package without executing its `__init__`.
+        all_modinfos = _iter_command_modules(modname)
+        modinfos = self._select_command_modules(all_modinfos)
+
+        self._load_command_modules(modname, modinfos, prefix, suffix, base_name)
+
+        if len(modinfos) < len(all_modinfos):
+            rest = [x for x in all_modinfos if x not in modinfos]
+            # a module's name need not match the command it registers;
+            # if a selecting token is still not a known command, the
+            # pruning guessed wrong -- fall back to loading the rest.
+            choices = self.parser._subparsers_action.choices  # type: ignore[attr-defined]
+            if any(modinfo.name not in choices for modinfo in modinfos):
+                self._load_command_modules(modname, rest, prefix, suffix, base_name)
+            else:
+                # an option value can also collide with a module name
+                # while the real command hides behind an alias or an
+                # off-name module; remember how to load the rest so
+                # `_parse_args` can recover from a parse error once.
+                self._pruned_command_modules = (modname, rest, prefix, suffix, base_name)
+
+    def _load_command_modules(
+        self,
+        modname: str,
+        modinfos: Iterable[Any],
+        prefix: str | None,
+        suffix: str | None,
+        base_name: str,
+    ) -> None:
+        """Import each module in `modinfos` and register its command classes."""
+
+        for modinfo in modinfos:
             module = importlib.import_module(f"{modname}.{modinfo.name}", __name__)
 
             if not prefix and not suffix and hasattr(module, "Command"):
                 module.Command(self)
                 continue
 
-            for name in [x for x in dir(module) if x != base_name]:
+            # module.__dict__ avoids dir()'s sort and inherited names.
+            for name, cmd_class in module.__dict__.items():
+                if name == base_name or not isinstance(cmd_class, type):
+                    continue
                 if prefix and not name.startswith(prefix):
                     continue
                 if suffix and not name.endswith(suffix):
                     continue
-                try:
-                    cmd_class = getattr(module, name)
-                except AttributeError:
-                    continue
                 cmd_class(self)
 
+    def _select_command_modules(self, modinfos: Iterable[Any]) -> list[Any]:
+        """Return the command modules actually needed for this run.
+
+        When the command line clearly selects subcommands (tokens match
+        module names, and no help option is present), only the matching
+        modules need to be imported; every other run imports all of them.
+        """
+
+        modinfos = list(modinfos)
+        if os.getenv("_ARGCOMPLETE"):
+            return modinfos
+        argv = self.argv
+        if any(arg in ("-h", "--help", "-H", "--long-help", "--md-help") for arg in argv):
+            return modinfos
+        names = {modinfo.name for modinfo in modinfos}
+        tokens = {arg for arg in argv if arg in names}
+        if not tokens:
+            return modinfos
+        return [modinfo for modinfo in modinfos if modinfo.name in tokens]
+
     def _init_subcommands(self, **kwargs: Any) -> None:
         """Prepare to add subcommands to main parser."""
 
         subparsers = self.parser.add_subparsers(**kwargs)
-        self.add_parser = subparsers.add_parser
+        # direct reference for the help actions; skips scanning `_actions`.
+        self.parser._subparsers_action = subparsers  # type: ignore[attr-defined]
+
+        def _add_parser(name: str, **kwargs: Any) -> argparse.ArgumentParser:
+            # subcommand names recur throughout argparse structures; intern
+            # them so the copies share one string object.
+            return subparsers.add_parser(sys.intern(name), **kwargs)  # type: ignore[no-any-return]
+
+        self.add_parser = _add_parser
 
     def add_default_to_help(
         self,
@@ -340,6 +524,15 @@ class BaseCLI:
 
         if parser is None:
             parser = self.parser
+        elif (
+            isinstance(parser, argparse.ArgumentParser)
+            and parser is not self.parser
+            and not self._help_requested
+        ):
+            # subparser help is only rendered by an explicit help option;
+            # skip formatting defaults nobody will see. argument groups
+            # belong to the main parser, whose help may print any time.
+            return
         default = parser.get_default(arg.dest)
         if default is None:
             return
@@ -347,9 +540,8 @@ class BaseCLI:
             default = not default
         else:
             default = str(default)
-            home = str(Path.home())
-            if default.startswith(home):
-                default = "~" + default[len(home) :]
+            if default.startswith(_HOME_STR):
+                default = "~" + default[len(_HOME_STR) :]
         default = f" (default: `{default}`)"
 
         if arg.help and arg.help.endswith(self.help_line_ending):
@@ -357,17 +549,27 @@ class BaseCLI:
         else:
             arg.help += default
 
+    def _help_normalizer(self) -> Callable[[str | None], str | None]:
+        """Return a bound help-text normalizer for this CLI's settings.
+
+        The `help_first_char`/`help_line_ending` decisions are made once
+        here, not per help string.
+        """
+
+        if self.help_first_char == "upper":
+            first_xform: Callable[[str], str] | None = str.upper
+        elif self.help_first_char == "lower":
+            first_xform = str.lower
+        else:
+            first_xform = None
+        ending = self.help_line_ending or ""
+
+        return lambda text: _normalize_help(text, first_xform, ending)
+
     def _normalize_help_text(self, text: str | None) -> str | None:
         """Return help `text` with normalized first-character and line-ending."""
 
-        if text and text != argparse.SUPPRESS:
-            if self.help_line_ending and not text.endswith(self.help_line_ending):
-                text += self.help_line_ending
-            if self.help_first_char == "upper":
-                text = text[0].upper() + text[1:]
-            elif self.help_first_char == "lower":
-                text = text[0].lower() + text[1:]
-        return text
+        return self._help_normalizer()(text)
 
     @staticmethod
     def dedent(text: str) -> str:
@@ -377,26 +579,28 @@ class BaseCLI:
     @staticmethod
     def hideuser(path: Path) -> Path:
         """Replace home with tilde; complements `Path.expanduser`."""
-        _path = str(path)
-        _home = str(Path.home())
-        if not _path.startswith(_home):
+        try:
+            return Path("~") / path.relative_to(_HOME)
+        except ValueError:
             return path
-        return Path("~" + _path[len(_home) :])
 
     def error(self, text: str) -> None:
         """Print an ERROR message to `stdout`."""
         _ = self  # unused; avoiding @staticmethod
-        print(color("ERROR: " + text, "red"))
+        prefix, reset = _ansi("red", "ERROR: ")
+        print(f"{prefix}{text}{reset}")
 
     def info(self, text: str) -> None:
         """Print an INFO message to `stdout`."""
         if self.options.verbose > 0:
-            print(color("INFO: " + text, "cyan"))
+            prefix, reset = _ansi("cyan", "INFO: ")
+            print(f"{prefix}{text}{reset}")
 
     def debug(self, text: str) -> None:
         """Print a DEBUG message to `stdout`."""
         if self.options.verbose > 1:
-            print(color("DEBUG: " + text, "white"))
+            prefix, reset = _ansi("white", "DEBUG: ")
+            print(f"{prefix}{text}{reset}")
 
     # public
     # -------------------------------------------------------------------------------
@@ -404,39 +608,64 @@ class BaseCLI:
 
     def _update_config_from_file(self) -> None:
 
-        # sneak a peak for `--verbose` and `--config FILE`.
-        parser = argparse.ArgumentParser(add_help=False)
-        self._add_verbose_option(parser)
-        self._add_config_option(parser)
-        self.options, _ = parser.parse_known_args(self.argv)
+        # sneak a peak for `--verbose` and `--config FILE`; a plain argv
+        # scan, without paying for a throwaway ArgumentParser.
+        verbose = 0
+        config_file: Any = self.config.get("config-file")
+        args = iter(self.argv)
+        for arg in args:
+            if arg == "--":
+                break
+            if arg in ("-v", "--verbose"):
+                verbose += 1
+            elif arg.startswith("-v") and set(arg[1:]) == {"v"}:
+                verbose += len(arg) - 1
+            elif arg == "--config":
+                config_file = next(args, None)
+            elif arg.startswith("--config="):
+                config_file = arg.split("=", 1)[1]
+        if isinstance(config_file, str):
+            config_file = Path(config_file)
+        self.options = argparse.Namespace(verbose=verbose, config_file=config_file)
 
         self.init_logging(self.options.verbose)
 
+        if not verbose and not config_file:
+            # the dominant case: no `-v`, no config file anywhere.
+            return
+
         if not self.options.config_file:
             self.debug("config-file not defined or given.")
             return
 
-        self.debug(f"reading config-file `{self.options.config_file}`.")
+        if verbose > 1:
+            # don't build the f-string only for debug() to drop it.
+            self.debug(f"reading config-file `{config_file}`.")
+
+        from libcli._configcache import (  # pylint: disable=import-outside-toplevel
+            load_toml_cached,
+        )
 
         try:
             _path = Path(self.options.config_file).expanduser()
-            _text = _path.read_text(encoding="utf-8")
-            config = tomli.loads(_text)
+            config = load_toml_cached(_path)
         except FileNotFoundError as err:
             if self.options.config_file != self.config["config-file"]:
                 # postpone calling `parser.error` to full parser.
                 self.config["config-file"] = err
-            else:
+            elif verbose > 1:
                 self.debug(f"{err}; ignoring.")
             return
 
         if (section := self.config.get("config-name")) is not None:
             config = config.get(section, config)
 
+        # single probe per key; `in` + subscript would look up twice.
+        own_get = self.config.get
+        missing = object()
         for name, value in config.items():
-            if name in self.config:
-                _type = type(self.config[name])
-                config[name] = _type(value)
+            if (current := own_get(name, missing)) is not missing:
+                config[name] = type(current)(value)
 
         self.config.update(config)
 
@@ -494,16 +723,13 @@ class BaseCLI:
     ) -> None:
         """Add `--version` to given `parser`."""
 
-        version = "0.0.0"
-        with contextlib.suppress(importlib.metadata.PackageNotFoundError):
-            # https://docs.python.org/3/library/importlib.metadata.html#distribution-versions
-            version = importlib.metadata.version(self.distname)
-
+        # https://docs.python.org/3/library/importlib.metadata.html#distribution-versions
+        # the metadata lookup is deferred until `--version` is given.
         parser.add_argument(
             "-V",
             "--version",
-            action="version",
-            version=version,
+            action=LazyVersionAction,
+            distname=self.distname,
             help="print version number and exit",
         )
 
@@ -513,6 +739,15 @@ class BaseCLI:
 
         return self.config.get("dist-name") or self.config.get("config-name") or self.parser.prog
 
+    @functools.cached_property
+    def distribution(self) -> importlib.metadata.Distribution:
+        """Return the installed distribution; the sys.path walk runs once.
+
+        Raises `importlib.metadata.PackageNotFoundError` if not installed.
+        """
+
+        return importlib.metadata.distribution(self.distname)
+
     def _add_config_option(
         self, parser: argparse.ArgumentParser | argparse._ArgumentGroup
     ) -> None:
@@ -531,7 +766,8 @@ class BaseCLI:
     def _finalize(self) -> None:
         """Normalize `formatter_class` and `help` text of all parsers."""
 
-        if os.getenv("NOCOLOR"):
+        if os.getenv("NOCOLOR") or os.getenv("TERM") == "dumb" or not sys.stdout.isatty():
+            # color codes are wasted on pipes and files.
             formatter_class = argparse.RawDescriptionHelpFormatter
         else:
             formatter_class = ColorHelpFormatter
@@ -539,23 +775,43 @@ class BaseCLI:
         if self.parser.formatter_class == argparse.HelpFormatter:
             self.parser.formatter_class = formatter_class
 
+        normalize = self._help_normalizer()
+
+        if self.add_parser is None:
+            # flat CLI; no subparsers to consider.
+            for action in self.parser._actions:
+                action.help = normalize(action.help)
+            return
+
+        # subparser help is only rendered by an explicit help option;
+        # when none is on the command line, skip walking the subparsers.
+        help_requested = self._help_requested
+
+        # `_init_subcommands` stashed the subparsers action; no need to
+        # isinstance-test argparse internals per action.
+        subparsers = getattr(self.parser, "_subparsers_action", None)
+
         for action in self.parser._actions:
-            if isinstance(action, argparse._SubParsersAction):
-                for choice in action._choices_actions:
-                    choice.help = self._normalize_help_text(choice.help)
-                for subparser in action.choices.values():
-                    if subparser.formatter_class == argparse.HelpFormatter:
-                        subparser.formatter_class = formatter_class
-                    if subparser._actions:
-                        for subact in subparser._actions:
-                            subact.help = self._normalize_help_text(subact.help)
-            else:
-                action.help = self._normalize_help_text(action.help)
+            if action is not subparsers:
+                action.help = normalize(action.help)
+
+        if subparsers is not None:
+            for choice in subparsers._choices_actions:
+                choice.help = normalize(choice.help)
+            if not help_requested:
+                return
+            default_formatter = argparse.HelpFormatter
+            # aliases repeat the same subparser; visit each once.
+            for subparser in dict.fromkeys(subparsers.choices.values()):
+                if subparser.formatter_class == default_formatter:
+                    subparser.formatter_class = formatter_class
+                for subact in subparser._actions:
+                    subact.help = normalize(subact.help)
 
     def _parse_args(self) -> argparse.Namespace:
         """Parse command line and return options."""
 
-        options = self.parser.parse_args(self.argv)
+        options = self._parse_args_recovering()
 
         if isinstance(self.config.get("config-file"), Exception):
             # postponed from load_config
@@ -564,9 +820,53 @@ class BaseCLI:
         self._update_config_from_options(options)
         return options
 
+    def _parse_args_recovering(self) -> argparse.Namespace:
+        """Parse argv, recovering once when pruning caused the error.
+
+        While command modules remain unloaded, a parse error may only
+        mean the pruning guessed wrong (an option value colliding with
+        a module name, a command behind an alias); trap the error, load
+        the rest, and give argparse one clean retry.
+        """
+
+        if self._pruned_command_modules is None:
+            return self.parser.parse_args(self.argv)
+
+        real_error = self.parser.error
+
+        def _trap(message: str) -> Any:
+            raise _RetryParse(message)
+
+        self.parser.error = _trap  # type: ignore[method-assign]
+        try:
+            return self.parser.parse_args(self.argv)
+        except _RetryParse:
+            modname, rest, prefix, suffix, base_name = self._pruned_command_modules
+            self._load_command_modules(modname, rest, prefix, suffix, base_name)
+        finally:
+            self._pruned_command_modules = None
+            self.parser.error = real_error  # type: ignore[method-assign]
+        return self.parser.parse_args(self.argv)
+
     def _update_config_from_options(self, options: object) -> None:
 
-        for name, value in self.config.items():
-            if name not in self.exclude_print_config:
-                optname = name.replace("-", "_")
-                self.config[name] = getattr(options, optname, value)
+        excluded = set(self.exclude_print_config)
+        for name, optname in self._config_optnames().items():
+            if name not in excluded:
+                self.config[name] = getattr(options, optname, self.config[name])
+
+    def _config_optnames(self) -> dict[str, str]:
+        """Return mapping of config keys to option dest names.
+
+        The mapping is static per CLI class; compute it once and cache it
+        on the class, interning both sides for by-identity dict lookups.
+        """
+
+        cls = type(self)
+        optnames: dict[str, str] | None = cls.__dict__.get("_config_optnames_cache")
+        if optnames is None or optnames.keys() != self.config.keys():
+            optnames = {
+                sys.intern(name): sys.intern(name.replace("-", "_")) for name in self.config
+            }
+            cls._config_optnames_cache = optnames  # type: ignore[attr-defined]
+        return optnames
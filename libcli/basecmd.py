@@ -1,6 +1,7 @@
 """Base command class."""
 
 import argparse
+import functools
 from typing import Any, Callable
 
 from libcli.basecli import BaseCLI
@@ -122,6 +123,10 @@ class BaseCmd:
 
     """
 
+    # a fresh instance exists per subcommand per CLI; slots skip the
+    # per-instance `__dict__` (subclasses opt in with `__slots__ = ()`).
+    __slots__ = ("cli", "options")
+
     def __init__(self, cli: BaseCLI) -> None:
         """Initialize base command instance.
 
@@ -158,7 +163,7 @@ class BaseCmd:
 
         assert self.cli.add_parser
         parser = self.cli.add_parser(name, **kwargs)
-        parser.set_defaults(cmd=lambda: self._promote_options(self.run), prog=name)
+        parser.set_defaults(cmd=functools.partial(self._promote_options, self.run), prog=name)
         return parser
 
     def _promote_options(self, run: Callable[[], None]) -> None:
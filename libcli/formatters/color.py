@@ -2,7 +2,6 @@
 
 import argparse
 import functools
-import re
 from typing import Iterable
 
 from colors.colors import color as _color  # type: ignore
@@ -14,14 +13,32 @@ _color_header = functools.partial(_color, fg="cyan")
 _color_title = functools.partial(_color, fg="yellow", style="bold")
 _color_usage = functools.partial(_color, fg="yellow", style="bold")
 
-_RE_CODE_SPAN = None
+_CODE_SPAN_OPEN, _, _CODE_SPAN_CLOSE = _color_code_span("|").partition("|")
 
 
 def _colorize_text(text: str) -> str:
-    global _RE_CODE_SPAN  # noqa
-    if _RE_CODE_SPAN is None:
-        _RE_CODE_SPAN = re.compile(r"`([^`]*)`")
-    return _RE_CODE_SPAN.sub(_color_code_span(r"`\1`"), text)
+    """Colorize backtick-delimited code spans in `text`.
+
+    A manual scan; most help strings have no backticks at all, and the
+    rest have only a pair or two — not worth the regex engine.
+    """
+
+    if "`" not in text:
+        return text
+    parts = []
+    i = 0
+    while True:
+        j = text.find("`", i)
+        k = text.find("`", j + 1) if j >= 0 else -1
+        if k < 0:
+            parts.append(text[i:])
+            break
+        parts.append(text[i:j])
+        parts.append(_CODE_SPAN_OPEN)
+        parts.append(text[j : k + 1])
+        parts.append(_CODE_SPAN_CLOSE)
+        i = k + 1
+    return "".join(parts)
 
 
 class ColorHelpFormatter(argparse.RawDescriptionHelpFormatter):
@@ -46,28 +63,34 @@ class ColorHelpFormatter(argparse.RawDescriptionHelpFormatter):
             return result.replace(prefix, _color_usage(prefix))
         return result  # pragma: no cover
 
+    _layout_key: tuple[int, int] | None = None
+
     def _format_action(self, action: argparse.Action) -> str:
-        # determine the required width and the entry label
-        help_position = min(self._action_max_length + 2, self._max_help_position)
-        help_width = max(self._width - help_position, 11)
-        action_width = help_position - self._current_indent - 2
+        # determine the required width and the entry label; these are
+        # invariant until the action table or indent level changes.
+        if (key := (self._action_max_length, self._current_indent)) != self._layout_key:
+            self._layout_key = key
+            self._help_position = min(self._action_max_length + 2, self._max_help_position)
+            self._help_width = max(self._width - self._help_position, 11)
+            self._action_width = self._help_position - self._current_indent - 2
+        help_position = self._help_position
+        help_width = self._help_width
+        action_width = self._action_width
+        indent = " " * self._current_indent
         action_header = self._format_action_invocation(action)
 
         # no help; start on same line and add a final newline
         if not action.help:
-            tup = self._current_indent, "", action_header
-            action_header = "%*s%s\n" % tup  # noqa: f-string
+            action_header = f"{indent}{action_header}\n"
 
         # short action name; start on the same line and pad two spaces
         elif len(action_header) <= action_width:
-            tup = self._current_indent, "", action_width, action_header  # type: ignore
-            action_header = "%*s%-*s  " % tup  # type: ignore  # noqa: f-string
+            action_header = f"{indent}{action_header:<{action_width}}  "
             indent_first = 0
 
         # long action name; start on the next line
         else:
-            tup = self._current_indent, "", action_header
-            action_header = "%*s%s\n" % tup  # noqa: f-string
+            action_header = f"{indent}{action_header}\n"
             indent_first = help_position
 
         # collect the pieces of the action help
@@ -78,9 +101,10 @@ class ColorHelpFormatter(argparse.RawDescriptionHelpFormatter):
             help_text = self._expand_help(action)
             help_text = _colorize_text(help_text)
             help_lines = self._split_lines(help_text, help_width)
-            parts.append("%*s%s\n" % (indent_first, "", help_lines[0]))  # noqa: f-string
+            parts.append(f"{'':{indent_first}}{help_lines[0]}\n")
+            pad = " " * help_position
             for line in help_lines[1:]:
-                parts.append("%*s%s\n" % (help_position, "", line))  # noqa: f-string
+                parts.append(f"{pad}{line}\n")
 
         # or add a newline if the description doesn't end with one
         elif not action_header.endswith("\n"):
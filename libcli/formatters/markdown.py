@@ -1,15 +1,45 @@
 """Render help in `markdown` format."""
 
 import argparse
-import re
+import functools
+import os
 from pathlib import Path
 from typing import Any, Iterable
 
-import tomli
+from libcli._configcache import _parse_toml
 
 __all__ = ["MarkdownHelpFormatter"]
 
 
+_HASHES = ("", "#", "##", "###", "####", "#####", "######")
+
+_USAGE_PREFIX = "usage: "
+_USAGE_LEN = len(_USAGE_PREFIX)
+
+
+@functools.lru_cache(maxsize=64)
+def _md_heading(text: str | None, level: int) -> str:
+    """Render a markdown heading; the input space is tiny, so memoize."""
+
+    if level <= 0:
+        return text or ""
+    return f"{_HASHES[min(level, 6)]} {text or ''}"
+
+
+@functools.lru_cache(maxsize=1)
+def _project_description(path: str, _mtime_ns: int) -> str | None:
+    """Return `[project] description` from TOML `path`, parsed at most once.
+
+    Keyed on mtime so an edited file re-parses; every formatter after the
+    first pays only a cache probe.
+    """
+
+    config = _parse_toml(Path(path))
+    if (project := config.get("project")) and (description := project.get("description")):
+        return str(description)
+    return None
+
+
 class MarkdownHelpFormatter(argparse.RawDescriptionHelpFormatter):
     """Render help in `markdown` format."""
 
@@ -28,11 +58,7 @@ class MarkdownHelpFormatter(argparse.RawDescriptionHelpFormatter):
     #     pattern = "[%s]" % re.escape(characters)
     #     return re.sub(pattern, _escape_char, raw_text)
 
-    @staticmethod
-    def _md_heading(text: str | None, level: int) -> str:
-        level = min(max(level, 0), 6)
-        _text = str(text) if text else ""
-        return str("#" * level + " " + _text) if level else _text
+    _md_heading = staticmethod(_md_heading)
 
     # def md_inline_code(raw_text):
     #     return "`%s`" % _md_escape(raw_text, characters="`")
@@ -49,6 +75,12 @@ class MarkdownHelpFormatter(argparse.RawDescriptionHelpFormatter):
     #         _md_escape(link_target, characters=")"),
     #     )
 
+    # class-level; argparse builds a formatter per render.
+    _md_level = {
+        "title": 3,  # 1 and 2 render <hr/> on github
+        "heading": 4,
+    }
+
     def __init__(
         self,
         prog: str,
@@ -57,22 +89,21 @@ class MarkdownHelpFormatter(argparse.RawDescriptionHelpFormatter):
         width: int | None = None,
     ):
         """Initialize MarkdownHelpFormatter."""
-        self._md_level = {
-            "title": 3,  # 1 and 2 render <hr/> on github
-            "heading": 4,
-        }
-
         super().__init__(prog, indent_increment, max_help_position, width)
 
-        self._md_title = self._prog
-        path = Path("pyproject.toml")
-        if (
-            path.exists()
-            and (config := tomli.loads(path.read_text(encoding="utf-8")))
-            and (project := config.get("project"))
-            and (description := project.get("description"))
-        ):
-            self._md_title += " - " + description
+    @functools.cached_property
+    def _md_title(self) -> str:
+        """Return title; reads pyproject.toml only if help is rendered."""
+
+        title = self._prog
+        try:
+            mtime_ns = os.stat("pyproject.toml").st_mtime_ns
+        except OSError:
+            pass
+        else:
+            if description := _project_description("pyproject.toml", mtime_ns):
+                title += " - " + description
+        return title
 
     def _format_usage(
         self,
@@ -84,20 +115,16 @@ class MarkdownHelpFormatter(argparse.RawDescriptionHelpFormatter):
 
         usage_text = super()._format_usage(usage, actions, groups, prefix)
 
-        lines = usage_text.splitlines(keepends=True)
+        # Replace 1st len("usage: ") chars with 4 spaces on all lines;
+        # continuation lines are indented to match the prefix, so the
+        # slice keeps wrapped usage aligned.
+        if usage_text.startswith(_USAGE_PREFIX):
+            lines = ["    " + x[_USAGE_LEN:] for x in usage_text.splitlines(keepends=True)]
+        else:
+            lines = ["    " + x for x in usage_text.splitlines(keepends=True)]
 
-        # Replace 1st len("usage: ") chars with 4 spaces on all lines.
-        if usage_text.startswith("usage: "):
-            lines = [x[7:] for x in lines]
-        lines = [" " * 4 + x for x in lines]
-
-        return (
-            "\n"
-            + self._md_heading("Usage", level=self._md_level["heading"])
-            + "\n"
-            + "".join(lines)
-            + "\n"
-        )
+        heading = self._md_heading("Usage", level=self._md_level["heading"])
+        return f"\n{heading}\n{''.join(lines)}\n"
 
     def format_help(self) -> str:
         """Format help."""
@@ -126,7 +153,15 @@ class MarkdownHelpFormatter(argparse.RawDescriptionHelpFormatter):
         # pylint: disable=protected-access
         # pylint: disable=too-few-public-methods
         def format_help(self) -> str:
-            # remove trailing colon from header line
-            section_text = super().format_help()
-            section_text = re.sub(r"^(\s*#+ [^\n]+):\n", "\\1\n", section_text)
-            return section_text
+            # remove trailing colon from header line; the shape is
+            # trivial, no need for the regex engine.
+            text = super().format_help()
+            head = len(text) - len(text.lstrip())
+            line_end = text.find("\n", head)
+            if line_end > 0 and text[line_end - 1] == ":" and text[head] == "#":
+                hashes = head
+                while text[hashes] == "#":
+                    hashes += 1
+                if text[hashes] == " " and hashes < line_end - 2:
+                    return text[: line_end - 1] + text[line_end:]
+            return text
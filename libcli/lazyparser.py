@@ -0,0 +1,107 @@
+"""Lazy argument parser.
+
+This module provides the `LazyArgumentParser` class.
+"""
+
+import argparse
+import sys
+from typing import Any, Callable
+
+__all__ = ["LazyArgumentParser"]
+
+# pylint: disable=protected-access
+
+
+class _LazySubParsersAction(argparse._SubParsersAction):
+    """Subparsers action that defers building subparsers until needed.
+
+    `add_parser` accepts an optional `loader` callable; when given, the
+    subparser is registered as a lightweight placeholder (only `prog` and
+    `help` are set), and `loader(subparser)` is not called until the
+    subcommand is actually selected on the command line, or until
+    `_materialize_all` is called (e.g., by `--long-help`).
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize `_LazySubParsersAction`."""
+        super().__init__(*args, **kwargs)
+        self._pending: dict[str, Callable[[argparse.ArgumentParser], None]] = {}
+
+    def add_parser(
+        self,
+        name: str,
+        *,
+        loader: Callable[[argparse.ArgumentParser], None] | None = None,
+        **kwargs: Any,
+    ) -> argparse.ArgumentParser:
+        """Add subparser `name`, deferring construction when `loader` is given."""
+
+        parser = super().add_parser(name, **kwargs)
+        if loader is not None:
+            self._pending[name] = loader
+            for alias in kwargs.get("aliases", []):
+                self._pending[alias] = loader
+        return parser
+
+    def _materialize(self, name: str) -> None:
+        """Run the pending loader for subparser `name`, if any."""
+
+        if (loader := self._pending.pop(name, None)) is not None:
+            subparser = self.choices[name]
+            # aliases share the subparser; drop their pending entries
+            # so the loader cannot run against it twice.
+            aliases = [
+                alias
+                for alias, pending in self._pending.items()
+                if pending is loader and self.choices.get(alias) is subparser
+            ]
+            for alias in aliases:
+                del self._pending[alias]
+            loader(subparser)
+
+    def _materialize_all(self) -> None:
+        """Run all pending loaders; e.g., before printing long help."""
+
+        for name in list(self._pending):
+            self._materialize(name)
+
+
+class LazyArgumentParser(argparse.ArgumentParser):
+    """ArgumentParser whose subparsers may be built lazily.
+
+    Subcommands registered with a `loader` are not constructed at parser
+    build time; they are materialized on demand when selected on the
+    command line. Common invocations (e.g., `prog -h`) skip construction
+    of all unselected subcommands entirely.
+    """
+
+    _lazy_subparsers_action: _LazySubParsersAction | None = None
+
+    def add_subparsers(self, **kwargs: Any) -> argparse._SubParsersAction:
+        """Wrap `add_subparsers` to return a `_LazySubParsersAction`."""
+
+        kwargs.setdefault("action", _LazySubParsersAction)
+        action = super().add_subparsers(**kwargs)
+        if isinstance(action, _LazySubParsersAction):
+            self._lazy_subparsers_action = action
+        return action
+
+    def parse_known_args(  # type: ignore[override]
+        self,
+        args: Any = None,
+        namespace: Any = None,
+    ) -> tuple[argparse.Namespace, list[str]]:
+        """Materialize the selected subcommand, then parse."""
+
+        action = self._lazy_subparsers_action
+        if action is not None and action._pending:
+            argv = sys.argv[1:] if args is None else list(args)
+            # an option value may collide with a pending name, so every
+            # matching token materializes; building a never-used
+            # subparser is cheap, skipping the used one is not.
+            for arg in argv:
+                if arg in action._pending:
+                    action._materialize(arg)
+                    if not action._pending:
+                        break
+        return super().parse_known_args(args, namespace)
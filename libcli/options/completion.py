@@ -1,7 +1,6 @@
 """Print completion scripts for `SHELL` and exit."""
 
 import argparse
-import subprocess
 from typing import Any, Sequence
 
 from libcli.actions.base import BaseAction
@@ -31,6 +30,8 @@ class CompletionOption(BaseOption):
 class CompletionAction(BaseAction):
     """Print completion scripts for `SHELL` and exit."""
 
+    __slots__ = ()
+
     def __call__(
         self,
         parser: argparse.ArgumentParser,
@@ -40,11 +41,23 @@ class CompletionAction(BaseAction):
     ) -> None:
         """Print completion scripts for `SHELL` and exit."""
 
-        argv = [
-            "register-python-argcomplete",
-            "-s",
-            str(values) if values else namespace.shell,
-            parser.prog,
-        ]
-        proc = subprocess.run(argv, check=False)
-        parser.exit(proc.returncode)
+        # pylint: disable=import-outside-toplevel
+        shell = str(values) if values else namespace.shell
+
+        try:
+            # in-process; no fork/exec of a second interpreter.
+            from argcomplete import shell_integration
+        except ImportError:
+            import subprocess
+
+            argv = ["register-python-argcomplete", "-s", shell, parser.prog]
+            proc = subprocess.run(argv, check=False)
+            parser.exit(proc.returncode)
+
+        shellcode = shell_integration.shellcode([parser.prog], shell=shell)
+        if not shellcode:
+            # same exit status as `register-python-argcomplete` gives
+            # for an unsupported shell.
+            parser.exit(2, f"Unsupported shell: {shell}\n")
+        print(shellcode)
+        parser.exit()
@@ -1,7 +1,6 @@
 """Print effective config and exit."""
 
 import argparse
-from pprint import pformat
 from typing import Any
 
 from libcli.actions.basehelp import BaseHelpAction
@@ -27,6 +26,8 @@ class PrintConfigOption(BaseOption):
 class PrintConfigAction(BaseHelpAction):
     """Print effective config and exit."""
 
+    __slots__ = ()
+
     def __call__(
         self,
         parser: argparse.ArgumentParser,
@@ -36,15 +37,25 @@ class PrintConfigAction(BaseHelpAction):
     ) -> None:
         """Print effective config and exit."""
 
-        config: dict[str, Any] = {}
-        for name, value in namespace.cli.config.items():
-            if name not in namespace.cli.exclude_print_config:
-                optname = name.replace("-", "_")
-                value = getattr(namespace, optname, value)
-                config[name] = value if isinstance(value, (int, str)) else str(value)
+        # pylint: disable=import-outside-toplevel
+        from pprint import pprint
 
-        if (name := namespace.cli.config.get("config-name")) is not None:
+        # pylint: disable=protected-access
+        cli = namespace.cli
+        optnames = cli._config_optnames()
+        excluded = frozenset(cli.exclude_print_config)
+
+        config: dict[str, Any] = {}
+        for name, value in cli.config.items():
+            if name in excluded:
+                continue
+            value = getattr(namespace, optnames[name], value)
+            if not isinstance(value, (int, str)):
+                value = str(value)
+            config[name] = value
+
+        if (name := cli.config.get("config-name")) is not None:
             config = {name: config}
 
-        print(pformat(config))
+        pprint(config)
         parser.exit()
@@ -1,8 +1,6 @@
 """Print `Project-URL` and exit."""
 
 import argparse
-import contextlib
-import importlib.metadata
 from typing import Any
 
 from libcli.actions.basehelp import BaseHelpAction
@@ -28,6 +26,8 @@ class PrintUrlOption(BaseOption):
 class PrintUrlAction(BaseHelpAction):
     """Print `Project-URL` and exit."""
 
+    __slots__ = ()
+
     def __call__(
         self,
         parser: argparse.ArgumentParser,
@@ -37,10 +37,15 @@ class PrintUrlAction(BaseHelpAction):
     ) -> None:
         """Print `Project-URL` and exit."""
 
-        with contextlib.suppress(importlib.metadata.PackageNotFoundError):
+        # pylint: disable=import-outside-toplevel
+        import importlib.metadata
+
+        try:
             # https://packaging.python.org/en/latest/specifications/core-metadata/#project-url-multiple-use
-            distro = importlib.metadata.distribution(namespace.cli.distname)
+            distro = namespace.cli.distribution
             if distro is not None and distro.metadata is not None:
                 print(distro.metadata.get("Project-URL", ""))
+        except importlib.metadata.PackageNotFoundError:
+            pass
 
         parser.exit()
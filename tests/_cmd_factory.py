@@ -0,0 +1,34 @@
+"""Shared subcommand factory for the `wumpus*` fixture packages."""
+
+import sys
+
+from libcli import BaseCmd
+
+__all__ = ["make_room_cmd"]
+
+
+def make_room_cmd(name: str, verb: str) -> type[BaseCmd]:
+    """Return a `BaseCmd` taking a ROOM argument for subcommand `name`."""
+
+    help_ = f"help for the `{name}` command"
+    output = verb + " to room {}\n"
+
+    class RoomCmd(BaseCmd):
+        """Room subcommand of Wumpus."""
+
+        __slots__ = ()
+
+        def init_command(self) -> None:
+
+            parser = self.add_subcommand_parser(
+                name,
+                help=help_,
+                description="Description of the `%(prog)s` command.",
+            )
+
+            parser.add_argument("room", type=int, help="help for `ROOM`")
+
+        def run(self) -> None:
+            sys.stdout.write(output.format(self.options.room))
+
+    return RoomCmd
@@ -0,0 +1,50 @@
+"""Shared `WumpusCLI` factory for the `test_wumpus*` modules."""
+
+from libcli import BaseCLI
+
+__all__ = ["make_wumpus_cli"]
+
+
+_DESCRIPTION = BaseCLI.dedent(
+    """
+    Hunt the Wumpus.
+
+    Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod
+    tempor incididunt ut `labore et dolore` magna aliqua. Ut enim ad minim
+    veniam, quis nostrud exercitation ullamco laboris nisi ut aliquip ex ea
+    commodo consequat. Duis aute irure dolor in reprehenderit in voluptate
+    velit `esse cillum dolore eu` fugiat nulla pariatur. Excepteur sint
+    occaecat cupidatat non proident, sunt in culpa qui officia deserunt
+    mollit anim id est laborum.
+    """
+)
+
+
+def make_wumpus_cli(
+    module: str,
+    prefix: str | None = None,
+    suffix: str | None = None,
+) -> type[BaseCLI]:
+    """Return a `WumpusCLI` class loading its subcommands from `module`."""
+
+    class WumpusCLI(BaseCLI):
+        """Wumpus command line interface."""
+
+        def init_parser(self) -> None:
+            self.ArgumentParser(
+                prog="wumpus",
+                description=_DESCRIPTION,
+            )
+
+        def add_arguments(self) -> None:
+            self.add_subcommand_modules(module, prefix=prefix, suffix=suffix)
+
+        def main(self) -> None:
+
+            if not self.options.cmd:
+                self.parser.print_help()
+                self.parser.exit(2, "error: Missing COMMAND\n")
+
+            self.options.cmd()
+
+    return WumpusCLI
@@ -0,0 +1,43 @@
+"""Shared test helpers."""
+
+import os
+from typing import Any, Callable, Iterator
+
+import pytest
+
+# argparse routes every usage/error string through gettext, and a
+# non-C locale makes gettext.find stat .mo paths on each lookup; pin
+# the locale so the many bogus-option tests skip that entirely.
+os.environ.setdefault("LC_ALL", "C")
+
+__all__ = ["assert_exit"]
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _isolate_cache_dir(tmp_path_factory: pytest.TempPathFactory) -> Iterator[None]:
+    """Keep libcli's on-disk caches out of the real user cache dir.
+
+    The config and help caches key on absolute paths, so every
+    `tmp_path` config file would otherwise leave an orphan entry under
+    `~/.cache/libcli` forever.
+    """
+
+    monkeypatch = pytest.MonkeyPatch()
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache")))
+    yield
+    monkeypatch.undo()
+
+
+def assert_exit(code: int | None, fn: Callable[..., Any], *args: Any) -> None:
+    """Assert that `fn(*args)` raises `SystemExit` with exit `code`.
+
+    One try/except replaces the `pytest.raises` context manager and its
+    ExceptionInfo bookkeeping at each of the many exit-code call sites.
+    """
+
+    try:
+        fn(*args)
+    except SystemExit as err:
+        assert err.code == code
+    else:
+        pytest.fail(f"expected SystemExit({code})")
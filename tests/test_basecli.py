@@ -3,6 +3,7 @@ import sys
 import pytest
 
 from libcli import BaseCLI
+from tests.conftest import assert_exit
 
 sys.argv = [sys.argv[0]]
 
@@ -32,85 +33,58 @@ class SimpleCLI(BaseCLI):
         print("Running", self)
 
 
-def main(args: list[str] | None = None) -> None:
-    """Command line interface entry point (function)."""
-    SimpleCLI(args).main()
-
-
 def test_no_args() -> None:
-    main()
+    SimpleCLI().main()
 
 
 def test_none_args() -> None:
-    main(None)
+    SimpleCLI(None).main()
 
 
 def test_empty_args() -> None:
-    main([])
+    SimpleCLI([]).main()
 
 
 def test_version() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["--version"])
-    assert err.value.code == 0
+    assert_exit(0, SimpleCLI, ["--version"])
 
 
 def test_help() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["--help"])
-    assert err.value.code == 0
+    assert_exit(0, SimpleCLI, ["--help"])
 
 
 def test_md_help() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["--md-help"])
-    assert err.value.code == 0
+    assert_exit(0, SimpleCLI, ["--md-help"])
 
 
 def test_long_help() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["--long-help"])
-    assert err.value.code == 2
+    assert_exit(2, SimpleCLI, ["--long-help"])
 
 
 def test_bogus_option() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["--bogus-option"])
-    assert err.value.code == 2
+    assert_exit(2, SimpleCLI, ["--bogus-option"])
 
 
 def test_bogus_argument() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["bogus-argument"])
-    assert err.value.code == 2
+    assert_exit(2, SimpleCLI, ["bogus-argument"])
 
 
 def test_print_config() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["--print-config"])
-    assert err.value.code == 0
+    assert_exit(0, SimpleCLI, ["--print-config"])
 
 
 def test_print_url() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["--print-url"])
-    assert err.value.code == 0
+    assert_exit(0, SimpleCLI, ["--print-url"])
 
 
 def test_completion() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["--completion"])
-    assert err.value.code == 0
+    assert_exit(0, SimpleCLI, ["--completion"])
 
 
 def test_completion_bogus() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["--completion", "bogus"])
-    assert err.value.code == 2
+    assert_exit(2, SimpleCLI, ["--completion", "bogus"])
 
 
 @pytest.mark.parametrize("shell", ["bash", "fish", "tcsh"])
 def test_completion_shell(shell: str) -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["--completion", shell])
-    assert err.value.code == 0
+    assert_exit(0, SimpleCLI, ["--completion", shell])
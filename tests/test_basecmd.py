@@ -3,16 +3,13 @@ from pathlib import Path
 import pytest
 
 from libcli import BaseCLI, BaseCmd
+from tests.conftest import assert_exit
 
 
-class ComplexCLI(BaseCLI):
-    """Complex command line interface."""
+_MASKED_PATH = Path.home().joinpath("username", "should", "be", "masked")
 
-    def init_parser(self) -> None:
-        self.ArgumentParser(
-            prog="complex",
-            description=self.dedent(
-                """
+_DESCRIPTION = BaseCLI.dedent(
+    """
     This is the `ComplexCLI` program.
 
     Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod
@@ -22,12 +19,21 @@ class ComplexCLI(BaseCLI):
     velit `esse cillum dolore eu` fugiat nulla pariatur. Excepteur sint
     occaecat cupidatat non proident, sunt in culpa qui officia deserunt
     mollit anim id est laborum.
-                """
-            ),
+    """
+)
+
+
+class ComplexCLI(BaseCLI):
+    """Complex command line interface."""
+
+    def init_parser(self) -> None:
+        self.ArgumentParser(
+            prog="complex",
+            description=_DESCRIPTION,
         )
 
     def add_arguments(self) -> None:
-        self.add_subcommand_classes([FirstCmd, SecondCmd])
+        self.add_subcommand_classes(_COMPLEX_SUBCMDS)
 
     def main(self) -> None:
 
@@ -38,14 +44,11 @@ class ComplexCLI(BaseCLI):
         self.options.cmd()
 
 
-def main(args: list[str] | None = None) -> None:
-    """Command line interface entry point (function)."""
-    ComplexCLI(args).main()
-
-
 class FirstCmd(BaseCmd):
     """First subcommand of ComplexCLI."""
 
+    __slots__ = ()
+
     def init_command(self) -> None:
 
         parser = self.add_subcommand_parser(
@@ -63,6 +66,8 @@ class FirstCmd(BaseCmd):
 class SecondCmd(BaseCmd):
     """Second subcommand of ComplexCLI."""
 
+    __slots__ = ()
+
     def init_command(self) -> None:
 
         parser = self.add_subcommand_parser(
@@ -75,7 +80,7 @@ class SecondCmd(BaseCmd):
 
         arg = parser.add_argument(
             "--path-opt",
-            default=Path.home() / "username" / "should" / "be" / "masked",
+            default=_MASKED_PATH,
             help="help for `--path-opt`.",  # note trailing period
         )
         self.cli.add_default_to_help(arg, parser)
@@ -92,122 +97,66 @@ class SecondCmd(BaseCmd):
         print("Running", self)
 
 
-# -------------------------------------------------------------------------------
-
-
-def test_version() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["--version"])
-    assert err.value.code == 0
-
-
-def test_help() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["--help"])
-    assert err.value.code == 0
-
+# shared across every ComplexCLI construction.
+_COMPLEX_SUBCMDS = (FirstCmd, SecondCmd)
 
-def test_md_help() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["--md-help"])
-    assert err.value.code == 0
 
-
-def test_long_help() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["--long-help"])
-    assert err.value.code == 0
-
-
-def test_bogus_option() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["--bogus-option"])
-    assert err.value.code == 2
+# -------------------------------------------------------------------------------
 
 
-def test_bogus_argument() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["bogus-argument"])
-    assert err.value.code == 2
+@pytest.fixture(scope="session", name="cli")
+def cli_() -> ComplexCLI:
+    """Build the CLI (and its full argparse tree) once for read-only tests."""
+    return ComplexCLI([])
 
 
-def test_print_config() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["--print-config"])
-    assert err.value.code == 0
+CASES = [
+    (("--version",), 0),
+    (("--help",), 0),
+    (("--md-help",), 0),
+    (("--long-help",), 0),
+    (("--bogus-option",), 2),
+    (("bogus-argument",), 2),
+    (("--print-config",), 0),
+    (("--print-url",), 0),
+    (("first", "--help"), 0),
+    (("first", "--bogus-option"), 2),
+    (("first", "bogus-argument"), 2),
+    (("first", "--first-opt"), 2),
+    (("second", "--help"), 0),
+    (("second", "--bogus-option"), 2),
+    (("second", "bogus-argument"), 2),
+    (("second", "--second-opt"), 2),
+]
 
 
-def test_print_url() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["--print-url"])
-    assert err.value.code == 0
+@pytest.mark.parametrize("argv, code", CASES, ids=[" ".join(argv) for argv, _ in CASES])
+def test_parser_exit(cli: ComplexCLI, argv: tuple[str, ...], code: int) -> None:
+    assert_exit(code, cli.parser.parse_args, argv)
 
 
 # -------------------------------------------------------------------------------
 
 
-def test_first_help() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["first", "--help"])
-    assert err.value.code == 0
-
-
-def test_first_bogus_option() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["first", "--bogus-option"])
-    assert err.value.code == 2
-
-
-def test_first_bogus_argument() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["first", "bogus-argument"])
-    assert err.value.code == 2
-
-
 def test_first() -> None:
-    main(["first"])
-
-
-def test_first_option_missing() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["first", "--first-opt"])
-    assert err.value.code == 2
+    ComplexCLI(["first"]).main()
 
 
 def test_first_option_ok() -> None:
-    main(["first", "--first-opt", "hello"])
-
-
-# -------------------------------------------------------------------------------
-
-
-def test_second_help() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["second", "--help"])
-    assert err.value.code == 0
-
-
-def test_second_bogus_option() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["second", "--bogus-option"])
-    assert err.value.code == 2
-
-
-def test_second_bogus_argument() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["second", "bogus-argument"])
-    assert err.value.code == 2
+    ComplexCLI(["first", "--first-opt", "hello"]).main()
 
 
 def test_second() -> None:
-    main(["second"])
+    ComplexCLI(["second"]).main()
 
 
-def test_second_option_missing() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["second", "--second-opt"])
-    assert err.value.code == 2
+def test_second_option_ok() -> None:
+    ComplexCLI(["second", "--second-opt", "hello"]).main()
 
 
-def test_second_option_ok() -> None:
-    main(["second", "--second-opt", "hello"])
+def test_second_help_full_construction(capsys: pytest.CaptureFixture[str]) -> None:
+    # the session fixture builds with empty argv, so only a full
+    # constructor with a help flag exercises _help_requested,
+    # add_default_to_help's home masking, and subparser normalization.
+    assert_exit(0, ComplexCLI, ["second", "--help"])
+    assert "`~/username/should/be/masked`" in capsys.readouterr().out
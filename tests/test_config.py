@@ -1,29 +1,23 @@
-import os
-from tempfile import mkstemp
-from typing import Iterator
-
 import pytest
 
 from libcli import BaseCLI
+from tests.conftest import assert_exit
 
 
-@pytest.fixture(name="config_file")
-def config_file_() -> Iterator[str]:
-    fd, name = mkstemp()
-    with os.fdopen(fd, mode="w", encoding="utf-8") as fp:
-        fp.write(
-            BaseCLI.dedent(
-                """
-                [myapp]
-                name = "Rumpelstiltskin"
-                value = 42
-                """
-            )
-        )
-        fp.close()
-        yield name
-    #
-    os.unlink(name)
+@pytest.fixture(name="config_file", scope="module")
+def config_file_(tmp_path_factory: pytest.TempPathFactory) -> str:
+    path = tmp_path_factory.mktemp("cfg") / "app.toml"
+    path.write_text(
+        BaseCLI.dedent(
+            """
+            [myapp]
+            name = "Rumpelstiltskin"
+            value = 42
+            """
+        ),
+        encoding="utf-8",
+    )
+    return str(path)
 
 
 def test_print_config_enoent() -> None:
@@ -31,9 +25,7 @@ def test_print_config_enoent() -> None:
     class CLI(BaseCLI):
         pass
 
-    with pytest.raises(SystemExit) as err:
-        CLI(["--config", "./cant/find/me"])
-    assert err.value.code == 2
+    assert_exit(2, CLI, ["--config", "./cant/find/me"])
 
 
 def test_print_config(config_file: str) -> None:
@@ -51,6 +43,4 @@ def test_print_config(config_file: str) -> None:
             assert self.config["name"] == "Rumpelstiltskin"
             assert self.config["value"] == 42
 
-    with pytest.raises(SystemExit) as err:
-        CLI(["--config", config_file, "--print-config"])
-    assert err.value.code == 0
+    assert_exit(0, CLI, ["--config", config_file, "--print-config"])
@@ -0,0 +1,80 @@
+import argparse
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from libcli.actions._helpcache import _FORMAT_VERSION, cache_key, cached_render
+
+
+@pytest.fixture(name="cache_home")
+def cache_home_(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the help cache at a private directory."""
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.delenv("LIBCLI_NO_HELP_CACHE", raising=False)
+    # `_cache_path` keys on the entry point's mtime; other test modules
+    # leave an un-statable sys.argv[0] behind, so pin a real file.
+    monkeypatch.setattr("sys.argv", [__file__])
+    return tmp_path / "libcli"
+
+
+def _namespace(distname: str | None, config: dict | None = None) -> argparse.Namespace:
+    namespace = argparse.Namespace()
+    namespace.cli = SimpleNamespace(distname=distname, config=config or {})
+    return namespace
+
+
+def test_cache_key_uninstalled_prog() -> None:
+    parser = argparse.ArgumentParser(prog="notinstalled")
+    assert cache_key("long", parser, _namespace("no-such-dist")) is None
+
+
+def test_cache_key_config_file() -> None:
+    parser = argparse.ArgumentParser(prog="prog")
+    namespace = _namespace("pytest", {"config-file": "/etc/app.toml"})
+    assert cache_key("long", parser, namespace) is None
+
+
+def test_cache_key_varies_with_width(monkeypatch: pytest.MonkeyPatch) -> None:
+    parser = argparse.ArgumentParser(prog="prog")
+    namespace = _namespace("pytest")
+    monkeypatch.setenv("COLUMNS", "60")
+    narrow = cache_key("long", parser, namespace)
+    monkeypatch.setenv("COLUMNS", "120")
+    wide = cache_key("long", parser, namespace)
+    assert narrow is not None and wide is not None
+    assert narrow != wide
+
+
+def test_cached_render_hit_and_miss(cache_home: Path) -> None:
+    calls: list[int] = []
+
+    def producer() -> str:
+        calls.append(1)
+        return "TEXT"
+
+    assert cached_render("key", producer) == "TEXT"  # miss; renders and writes
+    assert cached_render("key", producer) == "TEXT"  # hit; replays from disk
+    assert len(calls) == 1
+    assert cached_render("other", producer) == "TEXT"  # different key misses
+    assert len(calls) == 2
+
+
+def test_cached_render_format_version_mismatch(cache_home: Path) -> None:
+    assert cached_render("key", lambda: "ONE") == "ONE"
+    path = next(cache_home.iterdir())
+    # an older on-disk format must be re-rendered, not misread.
+    path.write_bytes(b"\x00" + b"stale")
+    assert cached_render("key", lambda: "TWO") == "TWO"
+    assert path.read_bytes() == _FORMAT_VERSION + b"TWO"
+
+
+def test_cached_render_none_key_renders() -> None:
+    assert cached_render(None, lambda: "TEXT") == "TEXT"
+
+
+def test_cached_render_disabled(cache_home: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("LIBCLI_NO_HELP_CACHE", "1")
+    assert cached_render("key", lambda: "TEXT") == "TEXT"
+    assert not cache_home.exists()
@@ -0,0 +1,90 @@
+import pytest
+
+from libcli.lazyparser import LazyArgumentParser
+from tests.conftest import assert_exit
+
+# pylint: disable=protected-access
+
+
+def _build() -> tuple[LazyArgumentParser, dict[str, int]]:
+    """Return a parser with two lazy subcommands and their loader counts."""
+
+    calls = {"move": 0, "shoot": 0}
+
+    def make_loader(name: str):  # type: ignore[no-untyped-def]
+        def loader(subparser) -> None:  # type: ignore[no-untyped-def]
+            calls[name] += 1
+            subparser.add_argument("room", type=int)
+
+        return loader
+
+    parser = LazyArgumentParser(prog="wumpus")
+    subparsers = parser.add_subparsers(metavar="COMMAND")
+    subparsers.add_parser("move", help="help for `move`", loader=make_loader("move"))
+    subparsers.add_parser(
+        "shoot", aliases=["fire"], help="help for `shoot`", loader=make_loader("shoot")
+    )
+    return parser, calls
+
+
+def test_loaders_deferred_at_build() -> None:
+    _, calls = _build()
+    assert calls == {"move": 0, "shoot": 0}
+
+
+def test_unselected_subcommands_not_built() -> None:
+    parser, calls = _build()
+    options = parser.parse_args(["move", "12"])
+    assert options.room == 12
+    assert calls == {"move": 1, "shoot": 0}
+
+
+def test_alias_materializes_subcommand() -> None:
+    parser, calls = _build()
+    options = parser.parse_args(["fire", "7"])
+    assert options.room == 7
+    assert calls == {"move": 0, "shoot": 1}
+
+
+def test_materialize_runs_loader_once() -> None:
+    parser, calls = _build()
+    action = parser._lazy_subparsers_action
+    assert action is not None
+    parser.parse_args(["move", "12"])
+    action._materialize("move")
+    assert calls["move"] == 1
+
+
+def test_materialize_all() -> None:
+    parser, calls = _build()
+    action = parser._lazy_subparsers_action
+    assert action is not None
+    action._materialize_all()
+    assert calls == {"move": 1, "shoot": 1}
+    assert not action._pending
+
+
+def test_help_skips_pending_loaders() -> None:
+    parser, calls = _build()
+    assert_exit(0, parser.parse_args, ["--help"])
+    assert calls == {"move": 0, "shoot": 0}
+
+
+def test_option_value_colliding_with_pending_name() -> None:
+    parser, calls = _build()
+    parser.add_argument("--note")
+    options = parser.parse_args(["--note", "move", "shoot", "7"])
+    assert options.note == "move"
+    assert options.room == 7
+    # both tokens matched pending names; both materialized.
+    assert calls == {"move": 1, "shoot": 1}
+
+
+def test_eager_add_parser_without_loader() -> None:
+    parser = LazyArgumentParser(prog="plain")
+    subparsers = parser.add_subparsers(metavar="COMMAND")
+    sub = subparsers.add_parser("run", help="help for `run`")
+    sub.add_argument("--opt")
+    assert not subparsers._pending
+    options = parser.parse_args(["run", "--opt", "x"])
+    assert options.opt == "x"
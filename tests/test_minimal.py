@@ -3,6 +3,9 @@ import sys
 import pytest
 
 from libcli import BaseCLI
+from tests.conftest import assert_exit
+
+sys.argv = ["minimal"]
 
 
 class MinimalCLI(BaseCLI):
@@ -12,86 +15,50 @@ class MinimalCLI(BaseCLI):
         print("Running", self)
 
 
-def main(args: list[str] | None = None) -> None:
-    """Command line interface entry point (function)."""
-    sys.argv = ["minimal"]
-    MinimalCLI(args).main()
+@pytest.fixture(scope="session", name="cli")
+def cli_() -> MinimalCLI:
+    """Build the CLI (and its argparse tree) once for read-only tests."""
+    return MinimalCLI([])
 
 
 def test_no_args() -> None:
-    main()
+    MinimalCLI().main()
 
 
 def _test_none_args() -> None:
-    main(None)
+    MinimalCLI(None).main()
 
 
 def _test_empty_args() -> None:
-    main([])
-
-
-def test_version() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["--version"])
-    assert err.value.code == 0
-
-
-def test_help() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["--help"])
-    assert err.value.code == 0
-
-
-def test_md_help() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["--md-help"])
-    assert err.value.code == 0
-
-
-def test_long_help() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["--long-help"])
-    assert err.value.code == 2
-
-
-def test_bogus_option() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["--bogus-option"])
-    assert err.value.code == 2
-
-
-def test_bogus_argument() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["bogus-argument"])
-    assert err.value.code == 2
+    MinimalCLI([]).main()
 
 
-def test_print_config() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["--print-config"])
-    assert err.value.code == 0
+CASES = [
+    (("--version",), 0),
+    (("--help",), 0),
+    (("--md-help",), 0),
+    (("--long-help",), 2),
+    (("--bogus-option",), 2),
+    (("bogus-argument",), 2),
+    (("--print-config",), 0),
+    (("--print-url",), 0),
+]
 
 
-def test_print_url() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["--print-url"])
-    assert err.value.code == 0
+@pytest.mark.parametrize("argv, code", CASES, ids=[" ".join(argv) for argv, _ in CASES])
+def test_parser_exit(cli: MinimalCLI, argv: tuple[str, ...], code: int) -> None:
+    assert_exit(code, cli.parser.parse_args, argv)
 
 
-def test_completion() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["--completion"])
-    assert err.value.code == 0
+def test_completion(cli: MinimalCLI) -> None:
+    assert_exit(0, cli.parser.parse_args, ["--completion"])
 
 
-def test_completion_bogus() -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["--completion", "bogus"])
-    assert err.value.code == 2
+def test_completion_bogus(cli: MinimalCLI) -> None:
+    assert_exit(2, cli.parser.parse_args, ["--completion", "bogus"])
 
 
-@pytest.mark.parametrize("shell", ["bash", "fish", "tcsh"])
-def test_completion_shell(shell: str) -> None:
-    with pytest.raises(SystemExit) as err:
-        main(["--completion", shell])
-    assert err.value.code == 0
+def test_completion_shells(cli: MinimalCLI) -> None:
+    # One parser build covers all three shells; the action exits per call.
+    for shell in ("bash", "fish", "tcsh"):
+        assert_exit(0, cli.parser.parse_args, ["--completion", shell])
@@ -1,18 +1,3 @@
-from libcli import BaseCmd
+from tests._cmd_factory import make_room_cmd
 
-
-class Command(BaseCmd):
-    """Shoot subcommand of Wumpus."""
-
-    def init_command(self) -> None:
-
-        parser = self.add_subcommand_parser(
-            "shoot",
-            help="help for the `shoot` command",
-            description="Description of the `%(prog)s` command.",
-        )
-
-        parser.add_argument("room", type=int, help="help for `ROOM`")
-
-    def run(self) -> None:
-        print(f"Shoot to room {self.options.room}")
+Command = make_room_cmd("shoot", "Shoot")
@@ -1,18 +1,3 @@
-from libcli import BaseCmd
+from tests._cmd_factory import make_room_cmd
 
-
-class MoveCmd(BaseCmd):
-    """Move subcommand of Wumpus."""
-
-    def init_command(self) -> None:
-
-        parser = self.add_subcommand_parser(
-            "move",
-            help="help for the `move` command",
-            description="Description of the `%(prog)s` command.",
-        )
-
-        parser.add_argument("room", type=int, help="help for `ROOM`")
-
-    def run(self) -> None:
-        print(f"Move to room {self.options.room}")
+MoveCmd = make_room_cmd("move", "Move")